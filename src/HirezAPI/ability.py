@@ -1,8 +1,13 @@
 import io
-from typing import List, NamedTuple
+import logging
+import re
+from functools import cached_property
+from typing import List, NamedTuple, Tuple
 
 import aiohttp
 
+_logger = logging.getLogger(__name__)
+
 
 class _item:
     description: str
@@ -69,6 +74,8 @@ class Ability(object):
     name: str
     icon_url: str
     is_passive: bool
+    # Matches the ability's name anywhere in text, for blanking it out
+    name_pattern: re.Pattern
 
     def __init__(
         self,
@@ -83,6 +90,7 @@ class Ability(object):
         self.name = name
         self.icon_url = icon_url
         self.is_passive = is_passive
+        self.name_pattern = re.compile(re.escape(name), re.IGNORECASE)
 
     @staticmethod
     def from_json(obj, is_passive: bool = False):
@@ -94,35 +102,38 @@ class Ability(object):
         icon_url = obj["URL"]
         return Ability(item_description, id, name, icon_url, is_passive)
 
-    @property
-    def cooldown_by_rank(self) -> List[float]:
+    # Descriptions never change, so the rank values are parsed on first use only
+    @cached_property
+    def cooldown_by_rank(self) -> Tuple[float, ...]:
         cd_str = self.__item_description.cooldown
         if cd_str == "" or cd_str is None:
-            return []
+            return ()
         try:
-            return [float(cool.strip()) for cool in cd_str.replace("s", "").split("/")]
+            return tuple(
+                float(cool.strip()) for cool in cd_str.replace("s", "").split("/")
+            )
         except ValueError:
-            print(f"Error while extracting cooldowns from {cd_str}")
-            return []
+            _logger.warning("Error while extracting cooldowns from %s", cd_str)
+            return ()
 
     __cost_modifiers = ["+ 1 arrow per shot", "per shot", "Omi", "Rage", "every 0.5s."]
 
-    @property
-    def cost_by_rank(self) -> List[int]:
+    @cached_property
+    def cost_by_rank(self) -> Tuple[int, ...]:
         cost_str = self.__item_description.cost
         # Variable is a special case for Heimdallr's Bifrost
         if cost_str in ("", "None", "Variable") or cost_str is None:
-            return []
+            return ()
         # Special case for King Arthur's ultimate
         if cost_str == "35 (80) Energy & 40 Mana":
-            return [40]
+            return (40,)
         try:
             for modifier in self.__cost_modifiers:
                 cost_str = cost_str.replace(modifier, "")
-            return [int(cost.strip()) for cost in cost_str.split("/")]
+            return tuple(int(cost.strip()) for cost in cost_str.split("/"))
         except (ValueError, KeyError):
-            print(f"Error while extracting costs from {cost_str}")
-            return []
+            _logger.warning("Error while extracting costs from %s", cost_str)
+            return ()
 
     @property
     def cost_modifier(self) -> str:
@@ -0,0 +1,27 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    # Entries in least recently used order
+    __entries: "OrderedDict[K, V]"
+    __max_size: int
+
+    def __init__(self, max_size: int):
+        self.__entries = OrderedDict()
+        self.__max_size = max_size
+
+    def get(self, key: K) -> Optional[V]:
+        value = self.__entries.get(key)
+        if value is not None:
+            self.__entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V):
+        self.__entries[key] = value
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
@@ -217,6 +217,8 @@ class SmiteleGame:
     Attributes:
         context: A SmiteleGameContext object holding Discord related context
         god: A God object which indicates the answer to this particular game
+        skin: The randomly chosen Skin shown in the first round and the answer reveal
+        skin_card: The card art bytes for skin, cached for the answer reveal
     """
 
     choices: List[Tuple[God, bool]]
@@ -225,6 +227,7 @@ class SmiteleGame:
     easy_mode: bool = False
     god: God
     skin: Skin
+    skin_card: bytes
     __tasks: Set[asyncio.Task]
 
     def __init__(self, answer: God, context: SmiteleGameContext) -> None:
@@ -313,6 +316,9 @@ class Smitele(commands.Cog):
 
     __gods: Dict[GodId, God]
 
+    # Lowercased god names mapped to their God, for constant time guess lookups
+    __god_names: Dict[str, God]
+
     # Cached config values
     __config: dict = None
 
@@ -337,6 +343,7 @@ class Smitele(commands.Cog):
         self.__bot = _bot
         self.__smite_client = _provider
         self.__gods = _provider.gods
+        self.__god_names = {god.name.lower(): god for god in self.__gods.values()}
         self.__items = _provider.items
         self.__running_sessions = {}
         self.__tree_builder = ItemTreeBuilder(self.__items)
@@ -1240,19 +1247,31 @@ class Smitele(commands.Cog):
             return True
         return False
 
-    # Helper function for checking correctness
     @staticmethod
-    def __check_answer_message(guess: str, answer: str) -> bool:
-        guess = unidecode(guess).lower().replace("-", " ")
+    def __normalize_guess(guess: str) -> str:
+        # unidecode is a no-op for ASCII, which covers nearly every guess
+        if not guess.isascii():
+            guess = unidecode(guess)
+        return guess.lower().replace("-", " ")
+
+    # Compares an already normalized guess against an already lowercased answer
+    @staticmethod
+    def __is_near_match(guess: str, answer: str) -> bool:
         return (
-            guess == answer.lower()
-            or edit_distance.SequenceMatcher(a=guess, b=answer.lower()).distance() <= 1
+            guess == answer
+            or edit_distance.SequenceMatcher(a=guess, b=answer).distance() <= 1
         )
 
+    # Helper function for checking correctness
+    @staticmethod
+    def __check_answer_message(guess: str, answer: str) -> bool:
+        return Smitele.__is_near_match(Smitele.__normalize_guess(guess), answer.lower())
+
     def __update_choices(self, guess: str, game: SmiteleGame) -> None:
-        for idx, choice in enumerate(game.choices):
-            if self.__check_answer_message(guess, choice[0].name):
-                game.choices[idx] = (choice[0], True)
+        guess = self.__normalize_guess(guess)
+        for idx, (god, guessed) in enumerate(game.choices):
+            if not guessed and self.__is_near_match(guess, god.name.lower()):
+                game.choices[idx] = (god, True)
 
     # Primary command for starting a round of Smite-le!
     async def __smitele(self, message: discord.Message, *args: tuple) -> None:
@@ -1449,6 +1468,8 @@ class Smitele(commands.Cog):
         session.skin = skin
 
         with await skin.get_card_bytes() as skin_image:
+            # Keep the card around so revealing the answer doesn't refetch it
+            session.skin_card = skin_image.getvalue()
             with io.BytesIO() as file:
                 # Cropping the skin image that we got randomly
                 with Image.open(skin_image) as img:
@@ -1610,9 +1631,9 @@ class Smitele(commands.Cog):
     async def __countdown_loop(
         self, message: discord.Message, exp: float, embed: discord.Embed
     ) -> None:
-        while time.time() < exp:
+        while time.monotonic() < exp:
             await asyncio.sleep(1)
-            rem = math.ceil(exp - time.time())
+            rem = math.ceil(exp - time.monotonic())
             if rem >= 0:
                 embed.set_field_at(
                     0,
@@ -1621,6 +1642,14 @@ class Smitele(commands.Cog):
                 )
                 await message.edit(embed=embed)
 
+    # A missing reaction is cosmetic, but the reply carries the round result
+    @staticmethod
+    def __check_reply_results(reaction: Any, reply: Any) -> None:
+        if isinstance(reaction, Exception):
+            print(f"Failed to add reaction: {reaction!r}")
+        if isinstance(reply, BaseException):
+            raise reply
+
     async def __send_incorrect(
         self, desc: str, last_round: bool, session: SmiteleGame
     ) -> None:
@@ -1633,7 +1662,7 @@ class Smitele(commands.Cog):
             async with session.context.channel.typing():
                 desc += f" The answer was **{session.god.name}**."
                 answer_image = discord.File(
-                    await session.skin.get_card_bytes(),
+                    io.BytesIO(session.skin_card),
                     filename=f"{session.god.name}.jpg",
                 )
                 embed = discord.Embed(color=discord.Color.red(), description=desc)
@@ -1669,7 +1698,9 @@ class Smitele(commands.Cog):
             picture = discord.File(round_ctx.file_bytes, filename=round_ctx.file_name)
             embed.set_image(url=f"attachment://{round_ctx.file_name}")
 
-        exp = time.time() + 20
+        # Monotonic so that system clock adjustments can't skew the countdown or answer time
+        start = time.monotonic()
+        exp = start + 20
         sent = await context.channel.send(file=picture, embed=embed)
         task = session.add_task(
             self.__bot.loop.create_task(self.__countdown_loop(sent, exp, embed))
@@ -1685,42 +1716,49 @@ class Smitele(commands.Cog):
                 )
             )
         try:
-            msg = await asyncio.wait_for(
-                self.__wait_for_message(sent.id, session), timeout=20
-            )
+            msg = await asyncio.wait_for(self.__wait_for_message(session), timeout=20)
             if self.__check_answer_message(msg.content, session.god.name):
-                answer_time = time.time() - (exp - 20)
+                answer_time = time.monotonic() - start
                 task.cancel()
-                await msg.add_reaction("💯")
-                async with context.channel.typing():
-                    # These emojis are from my Discord server so I'll need to update these to be
-                    # more universal. :D
-                    ans_description = (
-                        f"✅ Correct, **{context.player.mention}**! "
-                        f"You got it in {round(answer_time)} seconds. "
-                        f"The answer was **{session.god.name}**. "
-                        "<:frogchamp:566686914858713108>"
-                    )
+                # These emojis are from my Discord server so I'll need to update these to be
+                # more universal. :D
+                ans_description = (
+                    f"✅ Correct, **{context.player.mention}**! "
+                    f"You got it in {round(answer_time)} seconds. "
+                    f"The answer was **{session.god.name}**. "
+                    "<:frogchamp:566686914858713108>"
+                )
 
-                    embed = discord.Embed(
-                        color=discord.Color.green(), description=ans_description
-                    )
-                    file_name = f"{session.god.name}.jpg"
-                    picture = discord.File(
-                        await session.skin.get_card_bytes(), filename=file_name
-                    )
-                    embed.set_image(url=f"attachment://{file_name}")
+                embed = discord.Embed(
+                    color=discord.Color.green(), description=ans_description
+                )
+                file_name = f"{session.god.name}.jpg"
+                picture = discord.File(
+                    io.BytesIO(session.skin_card), filename=file_name
+                )
+                embed.set_image(url=f"attachment://{file_name}")
 
-                    await context.channel.send(file=picture, embed=embed)
-                    return True
+                # The reaction and reply are independent requests, so send them together
+                async with context.channel.typing():
+                    results = await asyncio.gather(
+                        msg.add_reaction("💯"),
+                        context.channel.send(file=picture, embed=embed),
+                        return_exceptions=True,
+                    )
+                self.__check_reply_results(*results)
+                return True
             if session.easy_mode:
                 self.__update_choices(msg.content, session)
             task.cancel()
-            await msg.add_reaction("❌")
             inc_description = f"❌ Incorrect, **{context.player.mention}**."
-            await self.__send_incorrect(
-                inc_description, round_ctx.is_last_round(), session
+            results = await asyncio.gather(
+                msg.add_reaction("❌"),
+                self.__send_incorrect(
+                    inc_description, round_ctx.is_last_round(), session
+                ),
+                return_exceptions=True,
             )
+            self.__check_reply_results(*results)
             return False
         except asyncio.TimeoutError:
             inc_description = "❌⏲️ Time's up! <:killmyself:472184572407447573>"
@@ -1729,32 +1767,48 @@ class Smitele(commands.Cog):
             )
             return False
 
-    async def __wait_for_message(
-        self, last_message_id: int, game: SmiteleGame
-    ) -> discord.Message:
-        channel = game.context.channel
-        while (
-            channel.last_message_id == last_message_id
-            or not self.__validate_message(game)
-            or not await self.__check_answer_is_god(channel.last_message, game)
-        ):
-            await asyncio.sleep(0)
-        return channel.last_message
+    async def __wait_for_message(self, game: SmiteleGame) -> discord.Message:
+        channel_id = game.context.channel.id
+        player = game.context.player
+        # IDs of guesses already accepted, so a redelivered message isn't handled twice
+        seen_ids: Set[int] = set()
+
+        def check(msg: discord.Message) -> bool:
+            # Cheapest and most selective tests first, since this sees every message the bot does
+            if (
+                msg.channel.id != channel_id
+                or msg.author != player
+                or msg.content.startswith("$")
+                or msg.id in seen_ids
+            ):
+                return False
+            seen_ids.add(msg.id)
+            return True
 
-    def __validate_message(self, game: SmiteleGame) -> bool:
-        channel = game.context.channel
-        return (
-            channel.last_message.author != self.__bot.user
-            and not channel.last_message.content.startswith("$")
-            and channel.last_message.author == game.context.player
-        )
+        # A listener stays registered for the whole wait, so guesses sent while
+        # we're still replying to an unknown god name are queued instead of dropped
+        guesses: "asyncio.Queue[discord.Message]" = asyncio.Queue()
+
+        async def on_message(msg: discord.Message) -> None:
+            if check(msg):
+                guesses.put_nowait(msg)
+
+        self.__bot.add_listener(on_message, "on_message")
+        try:
+            while True:
+                msg = await guesses.get()
+                if await self.__check_answer_is_god(msg, game):
+                    return msg
+        finally:
+            self.__bot.remove_listener(on_message, "on_message")
 
     async def __check_answer_is_god(
         self, guess: discord.Message, game: SmiteleGame
     ) -> bool:
-        if any(
-            self.__check_answer_message(guess.content, god.name)
-            for god in list(self.__gods.values())
+        guess_name = self.__normalize_guess(guess.content)
+        # Exact names hit the index directly, only typos fall back to a scan
+        if guess_name in self.__god_names or any(
+            self.__is_near_match(guess_name, name) for name in self.__god_names
         ):
             return True
         await guess.add_reaction("❓")
@@ -1785,7 +1839,8 @@ if __name__ == "__main__":
     intents.message_content = True
     bot = commands.Bot(command_prefix="$", intents=intents)
     provider = SmiteProvider()
-    asyncio.run(provider.create())
+    # Load the provider on the bot's own loop rather than a throwaway one from asyncio.run
+    bot.loop.run_until_complete(provider.create())
     player_stats = PlayerStats(provider)
     smitele = Smitele(bot, provider)
     smite_triva = SmiteTrivia(bot, provider)
@@ -2,27 +2,31 @@ import asyncio
 import io
 import json
 import math
+import os
 import random
-import re
+import threading
 import time
+import traceback
 import uuid
 from enum import Enum
+from functools import partial
 from json.decoder import JSONDecodeError
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Coroutine, Dict, List, NamedTuple, Optional, Set, Tuple
 
 import discord
-import edit_distance
 from discord.ext import commands
 from unidecode import unidecode
 
 from player import Player, PlayerId
 from player_stats import QueueStats
 from SmiteProvider import SmiteProvider
+from ability import Ability
 from god import God, GodId
 from item import Item, ItemType
 from skin import Skin
 from HirezAPI import QueueId
 from item_tree_builder import ItemTreeBuilder
+from lru_cache import LRUCache
 
 
 class StoppedError(Exception):
@@ -52,6 +56,10 @@ class AnswerRange:
         if correct_value < min_value or correct_value > max_value:
             raise ValueError("correct_value must be bound by min_value and max_value")
 
+    @classmethod
+    def around(cls, value: int, delta: int, is_percent: bool = False) -> "AnswerRange":
+        return cls(max(value - delta, 0), value + delta, value, is_percent)
+
     def check_guess(self, guess: str) -> bool:
         try:
             guess_number = float(guess.replace("%", ""))
@@ -64,9 +72,20 @@ class AnswerRange:
         return f"{self.correct_value}{'%' if self.is_percent else ''}"
 
 
+class _NormalizedAnswer(NamedTuple):
+    value: str
+    without_the: str
+
+
 class TriviaAnswer:
     valid_answers: Optional[List[str]]
     answer_range: Optional[AnswerRange]
+    __normalized_answers: List[_NormalizedAnswer]
+    # The single numeric answer that wrong guesses are hinted towards, if any
+    number: Optional[float]
+    __NORMALIZE_TABLE = str.maketrans({"-": " ", "%": None})
+    # Two edits covers nearly any guess at shorter lengths, so those must be exact
+    __MIN_FUZZY_LENGTH = 4
 
     def __init__(
         self,
@@ -79,23 +98,74 @@ class TriviaAnswer:
         if self.valid_answers is not None and self.answer_range is not None:
             raise ValueError("Cannot specify both valid_answers and answer_range")
 
-    def check_guess(self, guess: str) -> bool:
-        if self.valid_answers is not None:
-            for answer in self.valid_answers:
-                answer = unidecode(str(answer)).lower().replace("-", " ")
-                correct = answer == unidecode(guess).lower().replace("-", " ").replace(
-                    "%", ""
+        # Answers never change, so normalize them once rather than on every guess
+        self.__normalized_answers = []
+        for answer in self.valid_answers or []:
+            normalized = self.__normalize(str(answer))
+            self.__normalized_answers.append(
+                _NormalizedAnswer(
+                    normalized,
+                    normalized.replace("the ", "")
+                    if normalized.startswith("the")
+                    else normalized,
                 )
-                if not correct and not answer.replace("%", "").isdigit():
-                    if answer.startswith("the") and not guess.lower().startswith("the"):
-                        answer = answer.replace("the ", "")
-                    correct = (
-                        edit_distance.SequenceMatcher(
-                            a=answer, b=guess.lower()
-                        ).distance()
-                        <= 2
+            )
+
+        if self.answer_range is not None:
+            self.number = self.answer_range.correct_value
+        elif (
+            self.valid_answers is not None
+            and len(self.valid_answers) == 1
+            and str(self.valid_answers[0]).isdigit()
+        ):
+            self.number = int(self.valid_answers[0])
+        else:
+            self.number = None
+
+    @staticmethod
+    def __normalize(value: str) -> str:
+        # unidecode is a no-op for ASCII, which covers nearly every answer and guess
+        if not value.isascii():
+            value = unidecode(value)
+        return value.lower().translate(TriviaAnswer.__NORMALIZE_TABLE)
+
+    @staticmethod
+    def __within_distance(a: str, b: str, max_distance: int) -> bool:
+        # Levenshtein distance that gives up as soon as every cell in a row
+        # exceeds max_distance, since the distance can only grow from there
+        if abs(len(a) - len(b)) > max_distance:
+            return False
+        previous = list(range(len(b) + 1))
+        for i, a_char in enumerate(a, 1):
+            current = [i]
+            for j, b_char in enumerate(b, 1):
+                current.append(
+                    min(
+                        previous[j] + 1,
+                        current[j - 1] + 1,
+                        previous[j - 1] + (a_char != b_char),
                     )
-                if correct:
+                )
+            if min(current) > max_distance:
+                return False
+            previous = current
+        return previous[-1] <= max_distance
+
+    def check_guess(self, guess: str) -> bool:
+        if self.valid_answers is not None:
+            normalized_guess = self.__normalize(guess)
+            lower_guess = guess.lower()
+            guess_has_the = lower_guess.startswith("the")
+            for answer in self.__normalized_answers:
+                if answer.value == normalized_guess:
+                    return True
+                # Numbers must be exact, a near miss is a wrong guess
+                if answer.value.isdigit():
+                    continue
+                compared = answer.value if guess_has_the else answer.without_the
+                if len(compared) >= self.__MIN_FUZZY_LENGTH and self.__within_distance(
+                    compared, lower_guess, 2
+                ):
                     return True
         if self.answer_range is not None:
             return self.answer_range.check_guess(guess)
@@ -136,11 +206,7 @@ class TriviaQuestion:
         return self.answer.get_answer()
 
     def answer_is_number(self) -> bool:
-        return (
-            self.answer.valid_answers is not None
-            and len(self.answer.valid_answers) == 1
-            and all([a.isdigit() for a in self.answer.valid_answers])
-        ) or self.answer.answer_range is not None
+        return self.answer.number is not None
 
 
 class QuestionGenerator:
@@ -148,11 +214,25 @@ class QuestionGenerator:
     def question(self) -> Tuple[discord.Embed, TriviaQuestion, discord.File]:
         raise NotImplementedError
 
+    @staticmethod
+    def _choose(
+        question_bank: List[Callable[[], TriviaQuestion]],
+        extra_questions: List[Callable[[], TriviaQuestion]],
+    ) -> TriviaQuestion:
+        # Picks uniformly across both lists without concatenating them
+        index = random.randrange(len(question_bank) + len(extra_questions))
+        if index < len(question_bank):
+            return question_bank[index]()
+        return extra_questions[index - len(question_bank)]()
+
 
 class ItemQuestionGenerator(QuestionGenerator):
     __all_items: Dict[int, Item]
     __item: Item
-    __question_bank: Dict[ItemType, List[TriviaQuestion]]
+    # Total prices by item id, shared across generators since prices never change
+    __prices: Dict[int, int] = {}
+    # Questions are built on demand, since only one of them is ever asked
+    __question_bank: Dict[ItemType, List[Callable[[], TriviaQuestion]]]
 
     def __init__(self, item: Item, items: Dict[int, Item]):
         self.__all_items = items
@@ -161,10 +241,21 @@ class ItemQuestionGenerator(QuestionGenerator):
 
     @property
     def question(self) -> Tuple[discord.Embed, TriviaQuestion, discord.File]:
-        question_bank = self.__question_bank[self.__item.type].copy()
-        if self.__item.type == ItemType.ITEM and any(self.__item.item_properties):
-            question_bank.extend(self.__generate_properties_questions(self.__item))
-        question = random.choice(self.__question_bank[self.__item.type])
+        return self.ask()
+
+    # The tree question is passed in rather than kept, since generators are
+    # shared between rounds and each render hides a different random item
+    def ask(
+        self, tree_question: Optional[Callable[[], TriviaQuestion]] = None
+    ) -> Tuple[discord.Embed, TriviaQuestion, discord.File]:
+        extra_questions = (
+            self.__generate_properties_questions(self.__item)
+            if self.__item.type is ItemType.ITEM and self.__item.item_properties
+            else []
+        )
+        if tree_question is not None:
+            extra_questions.append(tree_question)
+        question = self._choose(self.__question_bank[self.__item.type], extra_questions)
         embed = discord.Embed(description=question.question)
         if question.image_url_or_bytes is not None:
             if isinstance(question.image_url_or_bytes, io.BytesIO):
@@ -175,80 +266,87 @@ class ItemQuestionGenerator(QuestionGenerator):
         return (embed, question, None)
 
     def __compute_price(self, item: Item) -> int:
-        price = item.price
-        parent_id = item.parent_item_id
-        while parent_id is not None:
-            parent = self.__all_items[parent_id]
-            price += parent.price
-            parent_id = parent.parent_item_id
-        return price
-
-    async def generate_tree_question(self):
+        if item.id not in self.__prices:
+            price = item.price
+            if item.parent_item_id is not None:
+                price += self.__compute_price(self.__all_items[item.parent_item_id])
+            self.__prices[item.id] = price
+        return self.__prices[item.id]
+
+    async def generate_tree_question(self) -> Callable[[], TriviaQuestion]:
         tree_builder = ItemTreeBuilder(self.__all_items)
         tree_image = await tree_builder.generate_build_tree(
             self.__item, trivia_mode=True
         )
 
-        self.__question_bank[ItemType.ITEM].append(
-            TriviaQuestion(
-                "What item has been replaced by a question mark in this tree?",
-                tree_builder.trivia_item.name,
-                tree_image,
-            )
+        trivia_item_name = tree_builder.trivia_item.name
+        return lambda: TriviaQuestion(
+            "What item has been replaced by a question mark in this tree?",
+            trivia_item_name,
+            tree_image,
         )
 
     def __init_question_bank(self):
         item = self.__item
         self.__question_bank = {
             ItemType.CONSUMABLE: [
-                TriviaQuestion(
+                lambda: TriviaQuestion(
                     f"How much does "
                     f'{"an" if item.name[0].lower() in "aeiou" else "a"} **{item.name}** cost?',
                     f"{item.price}",
                 ),
-                TriviaQuestion(
+                lambda: TriviaQuestion(
                     f"Name the consumable with this description: \n\n`{item.passive}`",
                     item.name,
                 ),
-                TriviaQuestion("What consumable is this?", item.name, item.icon_url),
+                lambda: TriviaQuestion(
+                    "What consumable is this?", item.name, item.icon_url
+                ),
             ],
             ItemType.RELIC: [
-                TriviaQuestion(
+                lambda: TriviaQuestion(
                     f"Name the relic with this description: \n\n`{item.passive}`",
                     item.name,
                 ),
-                TriviaQuestion("What relic is this?", item.name, item.icon_url),
+                lambda: TriviaQuestion("What relic is this?", item.name, item.icon_url),
             ],
-            ItemType.ITEM: list(
-                filter(
-                    lambda q: q is not None,
-                    [
-                        TriviaQuestion(
-                            f"How much does **{item.name}** cost?",
-                            f"{self.__compute_price(item)}",
-                        ),
-                        TriviaQuestion(
+            ItemType.ITEM: [
+                q
+                for q in [
+                    lambda: TriviaQuestion(
+                        f"How much does **{item.name}** cost?",
+                        f"{self.__compute_price(item)}",
+                    ),
+                    (
+                        lambda: TriviaQuestion(
                             f'Name the item with this {"passive" if item.passive is not None and item.passive.strip() != "" else "aura"}'
                             f':\n\n`{item.passive if item.passive is not None and item.passive.strip() != "" else item.aura.strip()}`',
                             item.name,
                         )
-                        if (item.passive is not None and item.passive.strip() != "")
-                        or (item.aura is not None and item.aura.strip() != "")
-                        else None,
-                        TriviaQuestion(
+                    )
+                    if (item.passive is not None and item.passive.strip() != "")
+                    or (item.aura is not None and item.aura.strip() != "")
+                    else None,
+                    (
+                        lambda: TriviaQuestion(
                             f"How much does it cost to upgrade **{self.__all_items[item.parent_item_id].name}** into **{item.name}**?",
                             f"{item.price}",
                         )
-                        if item.parent_item_id is not None and item.price > 0
-                        else None,
-                        TriviaQuestion("What item is this?", item.name, item.icon_url),
-                    ],
-                )
-            ),
+                    )
+                    if item.parent_item_id is not None and item.price > 0
+                    else None,
+                    lambda: TriviaQuestion(
+                        "What item is this?", item.name, item.icon_url
+                    ),
+                ]
+                if q is not None
+            ],
         }
 
     @staticmethod
-    def __generate_properties_questions(item: Item) -> List[TriviaQuestion]:
+    def __generate_properties_questions(
+        item: Item,
+    ) -> List[Callable[[], TriviaQuestion]]:
         prop = random.choice(item.item_properties)
         value: str = None
         if prop.flat_value is not None:
@@ -256,27 +354,26 @@ class ItemQuestionGenerator(QuestionGenerator):
         else:
             value = f"{int(prop.percent_value * 100)}%"
 
-        matched_values = list(
-            filter(
-                lambda ip: ip.flat_value == prop.flat_value
-                or ip.percent_value == prop.percent_value,
-                item.item_properties,
-            )
-        )
+        matched_values = [
+            ip
+            for ip in item.item_properties
+            if ip.flat_value == prop.flat_value
+            or ip.percent_value == prop.percent_value
+        ]
 
         return [
-            TriviaQuestion(
+            lambda: TriviaQuestion(
                 f'{"How much" if prop.flat_value is not None else "What percent"} '
                 f"**{prop.attribute.display_name}** does **{item.name}** provide?",
                 value,
             ),
-            TriviaQuestion(
+            lambda: TriviaQuestion(
                 f'{"How much" if prop.flat_value is not None else "What percent"} '
                 f"**{prop.attribute.display_name}** does this item provide?",
                 value,
                 item.icon_url,
             ),
-            TriviaQuestion(
+            lambda: TriviaQuestion(
                 f'Name {"the" if len(matched_values) == 1 else "a"} stat on **{item.name}** which provides **{value}**?',
                 TriviaAnswer([p.attribute.display_name for p in matched_values]),
             ),
@@ -285,8 +382,13 @@ class ItemQuestionGenerator(QuestionGenerator):
 
 class GodQuestionGenerator(QuestionGenerator):
     __god: God
-    __question_bank: List[TriviaQuestion]
+    # Questions are built on demand, since only one of them is ever asked
+    __question_bank: List[Callable[[], TriviaQuestion]]
     __provider: SmiteProvider
+    # Lore and ability descriptions with names blanked out, shared across
+    # generators since a new one is built for every question
+    __masked_lore: Dict[GodId, str] = {}
+    __masked_descriptions: Dict[int, str] = {}
 
     def __init__(self, god: God, provider: SmiteProvider):
         self.__god = god
@@ -295,52 +397,78 @@ class GodQuestionGenerator(QuestionGenerator):
 
     @property
     def question(self) -> Tuple[discord.Embed, TriviaQuestion, discord.File]:
-        question_bank = self.__question_bank.copy()
-        question_bank.extend(self.__generate_abilities_questions(self.__god))
-        question = random.choice(question_bank)
+        question = self._choose(
+            self.__question_bank, self.__generate_abilities_questions(self.__god)
+        )
         embed = discord.Embed(description=question.question)
         if question.image_url_or_bytes is not None:
             embed.set_image(url=question.image_url_or_bytes)
         return (embed, question, None)
 
+    @staticmethod
+    def __mask_lore(god: God) -> str:
+        if god.id not in GodQuestionGenerator.__masked_lore:
+            GodQuestionGenerator.__masked_lore[god.id] = god.lore.replace(
+                god.name, "_____"
+            ).replace("\\n", "\n")
+        return GodQuestionGenerator.__masked_lore[god.id]
+
+    @staticmethod
+    def __mask_description(ability: Ability) -> str:
+        if ability.id not in GodQuestionGenerator.__masked_descriptions:
+            GodQuestionGenerator.__masked_descriptions[
+                ability.id
+            ] = ability.name_pattern.sub("_____", ability.description)
+        return GodQuestionGenerator.__masked_descriptions[ability.id]
+
     def __init_question_bank(self):
         god = self.__god
-        lore = god.lore.replace(god.name, "_____").replace("\\n", "\n")
         self.__question_bank = [
-            TriviaQuestion(f"Name the god with this lore: \n\n```{lore}```", god.name),
-            TriviaQuestion(f"What pantheon is **{god.name}** a part of?", god.pantheon),
-            TriviaQuestion(f"Which god has the title **{god.title}**?", god.name),
-            TriviaQuestion(
+            lambda: TriviaQuestion(
+                f"Name the god with this lore: \n\n```{self.__mask_lore(god)}```",
+                god.name,
+            ),
+            lambda: TriviaQuestion(
+                f"What pantheon is **{god.name}** a part of?", god.pantheon
+            ),
+            lambda: TriviaQuestion(
+                f"Which god has the title **{god.title}**?", god.name
+            ),
+            lambda: TriviaQuestion(
                 f'Name {"one listed" if len(god.pros) > 1 else "the listed"} _pro_ for **{god.name}**.',
                 TriviaAnswer([pro.value.title() for pro in god.pros]),
             ),
-            TriviaQuestion(f"What role is **{god.name}**?", god.role.name.title()),
+            lambda: TriviaQuestion(
+                f"What role is **{god.name}**?", god.role.name.title()
+            ),
         ]
 
     async def generate_skin_question(self):
-        skins = list(
-            filter(
-                lambda s: s.obtainability not in ("Normal"),
-                [
-                    Skin.from_json(skin)
-                    for skin in await self.__provider.get_god_skins(self.__god.id)
-                ],
+        skins = [
+            skin
+            for skin in (
+                Skin.from_json(skin_json)
+                for skin_json in await self.__provider.get_god_skins(self.__god.id)
             )
-        )
+            if skin.obtainability not in ("Normal")
+        ]
 
-        if not any(skins):
+        if not skins:
             return
 
-        skin = random.choice(skins)
-
+        # Only the skin list is kept, so each ask can show a different skin
         self.__question_bank.append(
-            TriviaQuestion(
-                "Which god is this a skin for?", self.__god.name, skin.card_url
+            lambda: TriviaQuestion(
+                "Which god is this a skin for?",
+                self.__god.name,
+                random.choice(skins).card_url,
             )
         )
 
     @staticmethod
-    def __generate_abilities_questions(god: God) -> List[TriviaQuestion]:
+    def __generate_abilities_questions(
+        god: God,
+    ) -> List[Callable[[], TriviaQuestion]]:
         ability = random.choice(god.abilities)
         cooldown_rank = (
             random.randint(0, len(ability.cooldown_by_rank) - 1)
@@ -358,23 +486,22 @@ class GodQuestionGenerator(QuestionGenerator):
             else None
         )
 
-        pattern = re.compile(ability.name, re.IGNORECASE)
         ability_or_passive = f'**{"ability" if not ability.is_passive else "passive"}**'
 
-        return list(
-            filter(
-                lambda q: q is not None,
-                [
-                    TriviaQuestion(
-                        f'Name **{god.name}**\'s {ability_or_passive} with this description: \n\n`{pattern.sub("_____", ability.description)}`',
-                        ability.name,
-                    ),
-                    TriviaQuestion(
-                        f"What {ability_or_passive} is this?",
-                        ability.name,
-                        ability.icon_url,
-                    ),
-                    TriviaQuestion(
+        return [
+            q
+            for q in [
+                lambda: TriviaQuestion(
+                    f"Name **{god.name}**'s {ability_or_passive} with this description: \n\n`{GodQuestionGenerator.__mask_description(ability)}`",
+                    ability.name,
+                ),
+                lambda: TriviaQuestion(
+                    f"What {ability_or_passive} is this?",
+                    ability.name,
+                    ability.icon_url,
+                ),
+                (
+                    lambda: TriviaQuestion(
                         f"What is the cooldown (in seconds) for **{god.name}'s {ability.name}** at **rank {cooldown_rank + 1}**?",
                         TriviaAnswer(
                             [
@@ -384,56 +511,61 @@ class GodQuestionGenerator(QuestionGenerator):
                         ),
                         ability.icon_url,
                     )
-                    if cooldown_rank is not None
-                    else None,
-                    TriviaQuestion(
+                )
+                if cooldown_rank is not None
+                else None,
+                (
+                    lambda: TriviaQuestion(
                         f"What is the Mana (or Omi, Rage, etc.) cost for **{god.name}'s** **{ability.name}** at **rank {cost_rank + 1}**?",
                         TriviaAnswer(
-                            list(
-                                filter(
-                                    lambda a: a is not None,
-                                    [
-                                        f"{int(ability.cost_by_rank[cost_rank])}",
-                                        ability_with_modifier,
-                                    ],
-                                )
-                            )
+                            [
+                                a
+                                for a in [
+                                    f"{int(ability.cost_by_rank[cost_rank])}",
+                                    ability_with_modifier,
+                                ]
+                                if a is not None
+                            ]
                         ),
                         ability.icon_url,
                     )
-                    if cost_rank is not None
-                    else None,
-                ],
-            )
-        )
+                )
+                if cost_rank is not None
+                else None,
+            ]
+            if q is not None
+        ]
 
 
 class FriendQuestionGenerator(QuestionGenerator):
-    __friends: Dict[int, str]
+    __friend_items: Tuple[Tuple[int, str], ...]
     __provider: SmiteProvider
     __gods: Dict[GodId, God]
     __question_bank: List[TriviaQuestion]
 
+    __LOOKUP_BATCH_SIZE: int = 4
+    __QUEUE_IDS: Tuple[QueueId, ...] = tuple(QueueId)
+    __QUEUE_QUESTION_COUNT: int = 2
+    __QUEUE_SAMPLE_SIZE: int = 4
+
     def __init__(
         self, friends: Dict[int, str], provider: SmiteProvider, gods: Dict[GodId, God]
     ):
-        self.__friends = friends
+        self.__friend_items = tuple(friends.items())
         self.__provider = provider
         self.__gods = gods
         self.__question_bank = []
 
-    async def __get_random_friend(self) -> Tuple[int, Player | None]:
-        discord_user_id, smite_user_name = random.choice(list(self.__friends.items()))
-
+    async def __get_friend_player(self, smite_user_name: str) -> Player | None:
         player_ids = await self.__provider.get_player_id_by_name(smite_user_name)
 
-        if not any(player_ids):
-            return (discord_user_id, None)
+        if not player_ids:
+            return None
 
         player_id_info = PlayerId.from_json(player_ids[0], self.__provider)
 
         if player_id_info.private:
-            return (discord_user_id, None)
+            return None
 
         player = await player_id_info.get_player()
 
@@ -442,135 +574,142 @@ class FriendQuestionGenerator(QuestionGenerator):
                 id_override=player.active_player_id
             )
 
-        if player is None:
-            return (discord_user_id, None)
+        return player
+
+    async def __get_random_friend(self) -> Tuple[int, Player]:
+        friends = random.sample(self.__friend_items, len(self.__friend_items))
+
+        # Look up a few friends at once so private or missing profiles
+        # don't each cost a full round trip before the next is tried
+        for start in range(0, len(friends), self.__LOOKUP_BATCH_SIZE):
+            lookups = {
+                asyncio.create_task(
+                    self.__get_friend_player(smite_user_name)
+                ): discord_user_id
+                for discord_user_id, smite_user_name in friends[
+                    start : start + self.__LOOKUP_BATCH_SIZE
+                ]
+            }
+            pending = set(lookups)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for lookup in done:
+                        # One failed lookup shouldn't sink the others in flight
+                        if lookup.exception() is not None:
+                            print(
+                                f"Failed to look up friend {lookups[lookup]}: "
+                                f"{lookup.exception()!r}"
+                            )
+                            continue
+                        player = lookup.result()
+                        if player is not None:
+                            return (lookups[lookup], player)
+            finally:
+                # Covers an early return and cancellation alike
+                for lookup in pending:
+                    lookup.cancel()
 
-        return (discord_user_id, player)
+        raise ValueError("No friend has a public Smite profile")
 
     async def init_question_bank(self):
         discord_user_id, player = await self.__get_random_friend()
 
-        while player is None:
-            discord_user_id, player = await self.__get_random_friend()
-
         player_display_name = f"**{player.name}** (<@{discord_user_id}>)"
+        avatar_url = player.avatar_url
 
-        self.__question_bank = list(
-            filter(
-                lambda q: q is not None,
-                [
-                    TriviaQuestion(
-                        f"What clan is {player_display_name} a member of?",
-                        unidecode(player.clan_name),
-                        player.avatar_url,
-                    )
-                    if player.clan_name is not None and any(player.clan_name.strip())
-                    else None,
-                    TriviaQuestion(
-                        f"What account level (+/- 5) is {player_display_name}?",
-                        TriviaAnswer(
-                            answer_range=AnswerRange(
-                                max(player.level - 5, 0),
-                                player.level + 5,
-                                player.level,
-                            )
-                        ),
-                        player.avatar_url,
-                    ),
-                    TriviaQuestion(
-                        f"How many times (+/- 10) has {player_display_name} left a game?",
-                        TriviaAnswer(
-                            answer_range=AnswerRange(
-                                max(player.leaves - 10, 0),
-                                player.leaves + 10,
-                                player.leaves,
-                            )
-                        ),
-                        player.avatar_url,
-                    ),
-                    TriviaQuestion(
-                        f"What is {player_display_name}'s total playtime in hours (+/- 20 hours)?",
-                        TriviaAnswer(
-                            answer_range=AnswerRange(
-                                max(player.hours_played - 20, 0),
-                                player.hours_played + 20,
-                                player.hours_played,
-                            )
-                        ),
-                        player.avatar_url,
-                    ),
-                ],
-            )
+        # Sample a few extra distinct queues, since players often haven't played some
+        queue_ids = random.sample(
+            self.__QUEUE_IDS, k=min(self.__QUEUE_SAMPLE_SIZE, len(self.__QUEUE_IDS))
+        )
+        # These lookups are independent, so overlap their round trips
+        god_ranks, player_achievements, *queue_lists = await asyncio.gather(
+            self.__provider.get_god_ranks(player.id),
+            player.get_player_achievements(),
+            *(
+                self.__provider.get_queue_stats(player.id, queue_id)
+                for queue_id in queue_ids
+            ),
         )
 
-        for queue_id in player.ranked_stats.keys():
+        self.__question_bank = [
+            q
+            for q in [
+                TriviaQuestion(
+                    f"What clan is {player_display_name} a member of?",
+                    unidecode(player.clan_name),
+                    avatar_url,
+                )
+                if player.clan_name is not None and player.clan_name.strip()
+                else None,
+                TriviaQuestion(
+                    f"What account level (+/- 5) is {player_display_name}?",
+                    TriviaAnswer(answer_range=AnswerRange.around(player.level, 5)),
+                    avatar_url,
+                ),
+                TriviaQuestion(
+                    f"How many times (+/- 10) has {player_display_name} left a game?",
+                    TriviaAnswer(answer_range=AnswerRange.around(player.leaves, 10)),
+                    avatar_url,
+                ),
+                TriviaQuestion(
+                    f"What is {player_display_name}'s total playtime in hours (+/- 20 hours)?",
+                    TriviaAnswer(
+                        answer_range=AnswerRange.around(player.hours_played, 20)
+                    ),
+                    avatar_url,
+                ),
+            ]
+            if q is not None
+        ]
+
+        for queue_id, ranked_stats in player.ranked_stats.items():
+            queue_name = queue_id.display_name
             self.__question_bank.extend(
                 [
                     TriviaQuestion(
-                        f"What rank is {player_display_name} in **{queue_id.display_name}** currently?",
-                        player.ranked_stats[queue_id].tier.display_name,
-                        player.avatar_url,
+                        f"What rank is {player_display_name} in **{queue_name}** currently?",
+                        ranked_stats.tier.display_name,
+                        avatar_url,
                     ),
                     TriviaQuestion(
-                        f"What MMR (+/- 100) does {player_display_name} currently have in **{queue_id.display_name}**?",
+                        f"What MMR (+/- 100) does {player_display_name} currently have in **{queue_name}**?",
                         TriviaAnswer(
                             answer_range=AnswerRange(
-                                player.ranked_stats[queue_id].mmr - 100,
-                                player.ranked_stats[queue_id].mmr + 100,
-                                player.ranked_stats[queue_id].mmr,
+                                ranked_stats.mmr - 100,
+                                ranked_stats.mmr + 100,
+                                ranked_stats.mmr,
                             )
                         ),
-                        player.avatar_url,
+                        avatar_url,
                     ),
                     TriviaQuestion(
-                        f"How many times (+/- 5) has {player_display_name} left a **{queue_id.display_name}** game this season?",
+                        f"How many times (+/- 5) has {player_display_name} left a **{queue_name}** game this season?",
                         TriviaAnswer(
-                            answer_range=AnswerRange(
-                                max(player.ranked_stats[queue_id].leaves - 10, 0),
-                                player.ranked_stats[queue_id].leaves + 10,
-                                player.ranked_stats[queue_id].leaves,
-                            )
+                            answer_range=AnswerRange.around(ranked_stats.leaves, 10)
                         ),
-                        player.avatar_url,
+                        avatar_url,
                     ),
                 ]
             )
 
-        god_ranks = await self.__provider.get_god_ranks(player.id)
-
-        stats = {
-            GodId(int(god["god_id"])): {
-                "assists": int(god["Assists"]),
-                "deaths": int(god["Deaths"]),
-                "kills": int(god["Kills"]),
-                "losses": int(god["Losses"]),
-                "rank": int(god["Rank"]),
-                "wins": int(god["Wins"]),
-                "worshippers": int(god["Worshippers"]),
-                "minions": int(god["MinionKills"]),
-            }
-            for god in god_ranks
-        }
-
-        for god_id in random.choices(list(stats.keys()), k=2):
-            god_win_percent = stats[god_id]["wins"] / (
-                stats[god_id]["wins"] + stats[god_id]["losses"]
-            )
+        # Only two gods are asked about, so skip converting every god's stats
+        for god_rank in random.sample(god_ranks, k=min(2, len(god_ranks))):
+            god_name = self.__gods[GodId(int(god_rank["god_id"]))].name
+            worshippers = int(god_rank["Worshippers"])
+            wins = int(god_rank["Wins"])
+            god_win_percent = wins / (wins + int(god_rank["Losses"]))
             self.__question_bank.extend(
                 [
                     TriviaQuestion(
-                        f"How many worshippers (+/- 30) does {player_display_name} have on **{self.__gods[god_id].name}**?",
-                        TriviaAnswer(
-                            answer_range=AnswerRange(
-                                max(stats[god_id]["worshippers"] - 30, 0),
-                                stats[god_id]["worshippers"] + 30,
-                                stats[god_id]["worshippers"],
-                            )
-                        ),
-                        player.avatar_url,
+                        f"How many worshippers (+/- 30) does {player_display_name} have on **{god_name}**?",
+                        TriviaAnswer(answer_range=AnswerRange.around(worshippers, 30)),
+                        avatar_url,
                     ),
                     TriviaQuestion(
-                        f"What is {player_display_name}'s overall win percent (+/- 5%) on **{self.__gods[god_id].name}**?",
+                        f"What is {player_display_name}'s overall win percent (+/- 5%) on **{god_name}**?",
                         TriviaAnswer(
                             answer_range=AnswerRange(
                                 int(max(god_win_percent - 0.05, 0) * 100),
@@ -579,77 +718,71 @@ class FriendQuestionGenerator(QuestionGenerator):
                                 is_percent=True,
                             )
                         ),
-                        player.avatar_url,
+                        avatar_url,
                     ),
                 ]
             )
 
-        for queue_id in random.choices(list(QueueId), k=2):
-            queue_list = await self.__provider.get_queue_stats(player.id, queue_id)
-
-            if not any(queue_list):
-                continue
-
+        played_queue_lists = [
+            (queue_id, queue_list)
+            for queue_id, queue_list in zip(queue_ids, queue_lists)
+            if queue_list
+        ]
+        for queue_id, queue_list in played_queue_lists[: self.__QUEUE_QUESTION_COUNT]:
+            queue_name = queue_id.display_name
             queue_stats = QueueStats.from_json(queue_list)
 
             self.__question_bank.extend(
-                list(
-                    filter(
-                        lambda q: q is not None,
-                        [
-                            TriviaQuestion(
-                                f"What is {player_display_name}'s win rate (+/- 5%) in {queue_id.display_name}?",
-                                TriviaAnswer(
-                                    answer_range=AnswerRange(
-                                        int(
-                                            max(queue_stats.win_percent - 0.05, 0) * 100
-                                        ),
-                                        int(
-                                            min(queue_stats.win_percent + 0.05, 1) * 100
-                                        ),
-                                        int(queue_stats.win_percent * 100),
-                                        is_percent=True,
-                                    ),
+                [
+                    q
+                    for q in [
+                        TriviaQuestion(
+                            f"What is {player_display_name}'s win rate (+/- 5%) in {queue_name}?",
+                            TriviaAnswer(
+                                answer_range=AnswerRange(
+                                    int(max(queue_stats.win_percent - 0.05, 0) * 100),
+                                    int(min(queue_stats.win_percent + 0.05, 1) * 100),
+                                    int(queue_stats.win_percent * 100),
+                                    is_percent=True,
                                 ),
-                                player.avatar_url,
                             ),
-                            TriviaQuestion(
-                                f"What is {player_display_name}'s hours played (+/- 5 hours) in {queue_id.display_name}?",
-                                TriviaAnswer(
-                                    answer_range=AnswerRange(
-                                        int(
-                                            max(
-                                                (queue_stats.total_minutes - 300) / 60,
-                                                0,
-                                            )
-                                        ),
-                                        int((queue_stats.total_minutes + 300) / 60),
-                                        int(queue_stats.total_minutes / 60),
+                            avatar_url,
+                        ),
+                        TriviaQuestion(
+                            f"What is {player_display_name}'s hours played (+/- 5 hours) in {queue_name}?",
+                            TriviaAnswer(
+                                answer_range=AnswerRange(
+                                    int(
+                                        max(
+                                            (queue_stats.total_minutes - 300) / 60,
+                                            0,
+                                        )
                                     ),
+                                    int((queue_stats.total_minutes + 300) / 60),
+                                    int(queue_stats.total_minutes / 60),
                                 ),
-                                player.avatar_url,
                             ),
-                            TriviaQuestion(
-                                f"What is {player_display_name}'s best god in {queue_id.display_name}?",
-                                self.__gods[queue_stats.best_god].name,
-                                player.avatar_url,
-                            )
-                            if queue_stats.best_god is not None
-                            else None,
-                            TriviaQuestion(
-                                f"What is {player_display_name}'s worst god in {queue_id.display_name}?",
-                                self.__gods[queue_stats.worst_god].name,
-                                player.avatar_url,
-                            )
-                            if queue_stats.worst_god is not None
-                            else None,
-                        ],
-                    )
-                )
+                            avatar_url,
+                        ),
+                        TriviaQuestion(
+                            f"What is {player_display_name}'s best god in {queue_name}?",
+                            self.__gods[queue_stats.best_god].name,
+                            avatar_url,
+                        )
+                        if queue_stats.best_god is not None
+                        else None,
+                        TriviaQuestion(
+                            f"What is {player_display_name}'s worst god in {queue_name}?",
+                            self.__gods[queue_stats.worst_god].name,
+                            avatar_url,
+                        )
+                        if queue_stats.worst_god is not None
+                        else None,
+                    ]
+                    if q is not None
+                ]
             )
 
-        player_achievements = await player.get_player_achievements()
-
         multi_kills = [
             ("Double Kills", player_achievements.double_kills),
             ("Triple Kills", player_achievements.triple_kills),
@@ -681,71 +814,63 @@ class FriendQuestionGenerator(QuestionGenerator):
         objective_name, objective_count = random.choice(objectives)
 
         self.__question_bank.extend(
-            list(
-                filter(
-                    lambda q: q is not None,
-                    [
-                        TriviaQuestion(
-                            f"How many **{multi_kill_name}** (within +/- 5%) has {player_display_name} gotten?",
-                            TriviaAnswer(
-                                answer_range=AnswerRange(
-                                    max(
-                                        math.ceil(
-                                            multi_kill_count - (multi_kill_count * 0.05)
-                                        ),
-                                        0,
-                                    ),
+            [
+                q
+                for q in [
+                    TriviaQuestion(
+                        f"How many **{multi_kill_name}** (within +/- 5%) has {player_display_name} gotten?",
+                        TriviaAnswer(
+                            answer_range=AnswerRange(
+                                max(
                                     math.ceil(
-                                        multi_kill_count + (multi_kill_count * 0.05)
-                                    ),
-                                    multi_kill_count,
-                                )
-                            ),
-                        )
-                        if multi_kill_count > 0
-                        else None,
-                        TriviaQuestion(
-                            f"How many **{spree_name}** (within +/- 5%) has {player_display_name} been on?",
-                            TriviaAnswer(
-                                answer_range=AnswerRange(
-                                    max(
-                                        math.ceil(spree_count - (spree_count * 0.05)), 0
-                                    ),
-                                    math.ceil(spree_count + (spree_count * 0.05)),
-                                    spree_count,
-                                )
-                            ),
-                        )
-                        if spree_count > 0
-                        else None,
-                        TriviaQuestion(
-                            f"How many **{objective_name}** (within +/- 5%) has {player_display_name} killed?",
-                            TriviaAnswer(
-                                answer_range=AnswerRange(
-                                    max(
-                                        math.ceil(
-                                            objective_count - (objective_count * 0.05)
-                                        ),
-                                        0,
+                                        multi_kill_count - (multi_kill_count * 0.05)
                                     ),
+                                    0,
+                                ),
+                                math.ceil(multi_kill_count + (multi_kill_count * 0.05)),
+                                multi_kill_count,
+                            )
+                        ),
+                    )
+                    if multi_kill_count > 0
+                    else None,
+                    TriviaQuestion(
+                        f"How many **{spree_name}** (within +/- 5%) has {player_display_name} been on?",
+                        TriviaAnswer(
+                            answer_range=AnswerRange(
+                                max(math.ceil(spree_count - (spree_count * 0.05)), 0),
+                                math.ceil(spree_count + (spree_count * 0.05)),
+                                spree_count,
+                            )
+                        ),
+                    )
+                    if spree_count > 0
+                    else None,
+                    TriviaQuestion(
+                        f"How many **{objective_name}** (within +/- 5%) has {player_display_name} killed?",
+                        TriviaAnswer(
+                            answer_range=AnswerRange(
+                                max(
                                     math.ceil(
-                                        objective_count + (objective_count * 0.05)
+                                        objective_count - (objective_count * 0.05)
                                     ),
-                                    objective_count,
-                                )
-                            ),
-                        )
-                        if objective_count > 0
-                        else None,
-                    ],
-                )
-            )
+                                    0,
+                                ),
+                                math.ceil(objective_count + (objective_count * 0.05)),
+                                objective_count,
+                            )
+                        ),
+                    )
+                    if objective_count > 0
+                    else None,
+                ]
+                if q is not None
+            ]
         )
 
     @property
     def question(self) -> Tuple[discord.Embed, TriviaQuestion, discord.File]:
-        question_bank = self.__question_bank.copy()
-        question = random.choice(question_bank)
+        question = random.choice(self.__question_bank)
         embed = discord.Embed(description=question.question)
         if question.image_url_or_bytes is not None:
             embed.set_image(url=question.image_url_or_bytes)
@@ -765,9 +890,36 @@ class SmiteTrivia(commands.Cog):
     __bot: commands.Bot
     __consumables: List[Item]
     __gods: Dict[GodId, God]
+    __god_list: List[God]
     __items: List[Item]
     __relics: List[Item]
     __provider: SmiteProvider
+    __subject_pools: Dict[TriviaCategory, List[God] | List[Item]]
+    # Scores by stringified Discord user id, loaded from disk on first use
+    __scores_cache: Dict[str, int] | None
+    # The leaderboard order, rebuilt only after scores change
+    __sorted_scores: List[Tuple[str, int]] | None
+    __scores_dirty: bool
+    __scores_write_task: asyncio.Task | None
+    # Fire-and-forget tasks, held until they finish so they can't be collected early
+    __background_tasks: Set[asyncio.Task]
+    # Users by id with the monotonic time they were resolved
+    __users: LRUCache[int, Tuple[float, discord.User]]
+
+    # Generators by category and god or item id
+    __generators: LRUCache[Tuple[TriviaCategory, int], QuestionGenerator]
+
+    __CATEGORIES: Tuple[TriviaCategory, ...] = tuple(TriviaCategory)
+    __CATEGORY_WEIGHTS: Tuple[int, ...] = (1, 5, 5, 2, 5)
+    __CATEGORIES_BY_NAME: Dict[str, TriviaCategory] = {
+        c.name: c for c in TriviaCategory
+    }
+    __GENERATOR_CACHE_SIZE: int = 256
+    __USER_CACHE_SIZE: int = 256
+    __USER_CACHE_SECONDS: int = 300
+    __HINT_INTERVAL_SECONDS: int = 2
+    # Serializes scores.json writes between the background flush and unload
+    __SCORES_WRITE_LOCK: threading.Lock = threading.Lock()
 
     __FRIENDS: Dict[int, str] = {
         269238299019706369: "starfoxa",
@@ -792,20 +944,42 @@ class SmiteTrivia(commands.Cog):
     def __init__(self, bot: commands.Bot, provider: SmiteProvider):
         self.__bot = bot
         self.__gods = provider.gods
+        self.__god_list = list(self.__gods.values())
         self.__all_items = provider.items
         self.__provider = provider
+        self.__generators = LRUCache(self.__GENERATOR_CACHE_SIZE)
+        self.__scores_cache = None
+        self.__sorted_scores = None
+        self.__scores_dirty = False
+        self.__scores_write_task = None
+        self.__background_tasks = set()
+        self.__users = LRUCache(self.__USER_CACHE_SIZE)
+
+        self.__consumables = []
+        self.__items = []
+        self.__relics = []
+        item_pools = {
+            ItemType.CONSUMABLE: self.__consumables,
+            ItemType.ITEM: self.__items,
+            ItemType.RELIC: self.__relics,
+        }
+        # Sort the active items into their pools in a single pass
+        for item in self.__all_items.values():
+            if item.active and item.type in item_pools:
+                item_pools[item.type].append(item)
+
+        self.__subject_pools = {
+            TriviaCategory.CONSUMABLES: self.__consumables,
+            TriviaCategory.GODS: self.__god_list,
+            TriviaCategory.ITEMS: self.__items,
+            TriviaCategory.RELICS: self.__relics,
+        }
 
-        active_item_list = list(
-            filter(lambda i: i.active, list(self.__all_items.values()))
-        )
-
-        self.__consumables = list(
-            filter(lambda i: i.type == ItemType.CONSUMABLE, active_item_list)
-        )
-        self.__items = list(filter(lambda i: i.type == ItemType.ITEM, active_item_list))
-        self.__relics = list(
-            filter(lambda i: i.type == ItemType.RELIC, active_item_list)
-        )
+    def cog_unload(self):
+        # The loop may not run again, so write any unflushed scores now
+        if self.__scores_dirty:
+            self.__scores_dirty = False
+            self.__write_scores(json.dumps(self.__scores_cache))
 
     @commands.slash_command(
         name="trivia",
@@ -822,7 +996,7 @@ class SmiteTrivia(commands.Cog):
         name="category",
         type=str,
         description="The trivia category to ask questions about",
-        choices=[c.name.title() for c in list(TriviaCategory)],
+        choices=[c.name.title() for c in TriviaCategory],
         default="",
     )
     async def smitetrivia(
@@ -837,6 +1011,7 @@ class SmiteTrivia(commands.Cog):
     def __check_message(
         self,
         message: discord.Message,
+        *,
         attempted_answers: dict,
         question: TriviaQuestion,
     ):
@@ -845,124 +1020,121 @@ class SmiteTrivia(commands.Cog):
             return False
 
         if message.content.startswith("$stoptrivia"):
-            loop = asyncio.get_running_loop()
-            loop.create_task(
-                message.channel.send(
-                    embed=discord.Embed(
-                        color=discord.Color.red(), description="Trivia round canceled!"
-                    )
-                )
+            self.__send_later(
+                message.channel,
+                discord.Embed(
+                    color=discord.Color.red(), description="Trivia round canceled!"
+                ),
             )
             raise StoppedError
 
-        if message.author not in attempted_answers.keys():
-            attempted_answers[message.author] = {"answered": 1, "warned": False}
-        else:
-            attempted_answers[message.author]["answered"] += 1
+        state = attempted_answers.get(message.author)
+        if state is None:
+            state = attempted_answers[message.author] = {
+                "answered": 0,
+                "warned": False,
+                "hinted": None,
+            }
+        state["answered"] += 1
 
         correct = question.check_guess(message.content)
         if (
             not correct
             and question.answer_is_number()
             and message.content.replace("%", "").isdigit()
-            and attempted_answers[message.author]["answered"] < 3
+            and state["answered"] < 3
+            # Rapid-fire guesses share one hint, which keeps the channel's sends bounded
+            and (
+                state["hinted"] is None
+                or time.monotonic() - state["hinted"] >= self.__HINT_INTERVAL_SECONDS
+            )
         ):
             guess = int(message.content.replace("%", ""))
-            answer_number = int(question.get_answer().replace("%", ""))
-            loop = asyncio.get_running_loop()
-
-            if guess < answer_number:
-                loop.create_task(
-                    message.channel.send(
-                        embed=discord.Embed(
-                            color=discord.Color.blue(),
-                            description=f"Not quite, {message.author.mention}, try a higher guess. ↗️",
-                        )
-                    )
-                )
-            else:
-                loop.create_task(
-                    message.channel.send(
-                        embed=discord.Embed(
-                            color=discord.Color.blue(),
-                            description=f"Not quite, {message.author.mention}, try a lower guess. ↘️",
-                        )
-                    )
-                )
+            state["hinted"] = time.monotonic()
+
+            self.__send_later(
+                message.channel,
+                discord.Embed(
+                    color=discord.Color.blue(),
+                    description=f"Not quite, {message.author.mention}, try a higher guess. ↗️"
+                    if guess < question.answer.number
+                    else f"Not quite, {message.author.mention}, try a lower guess. ↘️",
+                ),
+            )
 
-        if correct and attempted_answers[message.author]["answered"] <= 3:
+        if correct and state["answered"] <= 3:
             return correct
 
-        if (
-            attempted_answers[message.author]["answered"] >= 3
-            and not attempted_answers[message.author]["warned"]
-        ):
-            loop = asyncio.get_running_loop()
-            loop.create_task(
-                message.channel.send(
-                    embed=discord.Embed(
-                        color=discord.Color.red(),
-                        description=f"{message.author.mention}, you've reached your maximum number of guesses. <:noshot:782396496104128573> Try again next question!",
-                    )
-                )
+        if state["answered"] >= 3 and not state["warned"]:
+            self.__send_later(
+                message.channel,
+                discord.Embed(
+                    color=discord.Color.red(),
+                    description=f"{message.author.mention}, you've reached your maximum number of guesses. <:noshot:782396496104128573> Try again next question!",
+                ),
             )
-            attempted_answers[message.author]["warned"] = True
+            state["warned"] = True
             return False
 
-    async def __countdown_loop(
-        self,
-        message: discord.Interaction | discord.WebhookMessage,
-        exp: float,
-        embed: discord.Embed,
-    ):
-        while time.time() < exp:
-            await asyncio.sleep(1)
-            rem = math.ceil(exp - time.time())
-            embed.set_field_at(
-                0,
-                name="Time Remaining:",
-                value=f'_{rem} second{"s" if rem != 1 else ""}_',
-            )
-            if isinstance(message, discord.Interaction):
-                interaction_message = await message.original_response()
-                await interaction_message.edit(embed=embed)
-                continue
-            await message.edit(embed=embed)
+    def __send_later(self, channel: discord.abc.Messageable, embed: discord.Embed):
+        # Message checks are synchronous, so replies are scheduled on the bot's loop
+        self.__run_in_background(channel.send(embed=embed))
+
+    def __run_in_background(self, coro: Coroutine) -> asyncio.Task:
+        # The loop only keeps weak references to tasks, so hold them until they finish
+        task = self.__bot.loop.create_task(coro)
+        self.__background_tasks.add(task)
+        task.add_done_callback(self.__background_tasks.discard)
+        return task
+
+    async def __get_generator(
+        self, category: TriviaCategory, subject: God | Item
+    ) -> QuestionGenerator:
+        key = (category, subject.id)
+        generator = self.__generators.get(key)
+
+        if generator is None:
+            if category is TriviaCategory.GODS:
+                generator = GodQuestionGenerator(subject, self.__provider)
+                await generator.generate_skin_question()
+            else:
+                generator = ItemQuestionGenerator(subject, self.__all_items)
+            self.__generators.put(key, generator)
+        return generator
+
+    def __draw_subjects(
+        self, categories: List[TriviaCategory]
+    ) -> List[God | Item | None]:
+        # Sample each pool without replacement so a round never repeats a god or item,
+        # falling back to None (a random pick) once a small pool runs out
+        draws: Dict[TriviaCategory, List[God | Item]] = {}
+        for category in set(categories):
+            if category in self.__subject_pools:
+                pool = self.__subject_pools[category]
+                draws[category] = random.sample(
+                    pool, min(categories.count(category), len(pool))
+                )
+        return [draws[c].pop() if draws.get(c) else None for c in categories]
 
     async def __get_next_question(
-        self, category: TriviaCategory = None
+        self, category: TriviaCategory, subject: God | Item | None = None
     ) -> Tuple[discord.Embed, TriviaQuestion, discord.File]:
-        if category is None:
-            category = random.choices(
-                list(TriviaCategory), weights=[1, 5, 5, 2, 5], k=1
-            )[0]
-        if category == TriviaCategory.CONSUMABLES:
-            return ItemQuestionGenerator(
-                random.choice(self.__consumables), self.__all_items
-            ).question
-        if category == TriviaCategory.GODS:
-            generator = GodQuestionGenerator(
-                random.choice(list(self.__gods.values())), self.__provider
-            )
-            await generator.generate_skin_question()
-            return generator.question
-        if category == TriviaCategory.ITEMS:
-            generator = ItemQuestionGenerator(
-                random.choice(self.__items), self.__all_items
-            )
-            await generator.generate_tree_question()
-            return generator.question
-        if category == TriviaCategory.RELICS:
-            return ItemQuestionGenerator(
-                random.choice(self.__relics), self.__all_items
-            ).question
-        if category == TriviaCategory.FRIENDS:
+        if category is TriviaCategory.FRIENDS:
+            # Not cached, since each generator is built around a random friend
             generator = FriendQuestionGenerator(
                 self.__FRIENDS, self.__provider, self.__gods
             )
             await generator.init_question_bank()
             return generator.question
-        raise ValueError
+        if category not in self.__subject_pools:
+            raise ValueError
+        if subject is None:
+            subject = random.choice(self.__subject_pools[category])
+        generator = await self.__get_generator(category, subject)
+        if category is TriviaCategory.ITEMS:
+            # Rendered again for every question so the hidden item is picked anew
+            return generator.ask(await generator.generate_tree_question())
+        return generator.question
 
     async def __smitetrivia(
         self, ctx: discord.ApplicationContext, question_count: int, input_category: str
@@ -972,7 +1144,6 @@ class SmiteTrivia(commands.Cog):
 
         correct_answers = {}
         was_stopped = False
-        asked_questions = set()
 
         if question_count > 20:
             await ctx.respond(
@@ -983,97 +1154,127 @@ class SmiteTrivia(commands.Cog):
             )
             return
 
-        if input_category is not None and any(input_category):
-            try:
-                input_category = TriviaCategory[input_category.upper()]
-            except KeyError:
+        if question_count < 1:
+            await ctx.respond(
+                embed=discord.Embed(
+                    color=discord.Color.red(),
+                    description="A round needs at least one question.",
+                )
+            )
+            return
+
+        if input_category:
+            category_name = input_category
+            input_category = self.__CATEGORIES_BY_NAME.get(category_name.upper())
+            if input_category is None:
                 await ctx.respond(
                     embed=discord.Embed(
                         color=discord.Color.red(),
-                        description=f"'{input_category}' is not a valid question category.",
+                        description=f"'{category_name}' is not a valid question category.",
                     )
                 )
                 return
         else:
             input_category = None
 
-        answers = {}
-        question: TriviaQuestion = None
-        for current_question in range(question_count):
-            answers.clear()
-            category = input_category
-            embed: discord.Embed = None
-            file: discord.File = None
-
-            while question is None or question.id in asked_questions:
-                embed, question, file = await self.__get_next_question(category)
-
-            asked_questions.add(question.id)
-
-            embed.title = (
-                f"❔ _Question **{current_question+1}** of **{question_count}**_"
-                if question_count > 1
-                else "❔ _Question_"
-            )
-            embed.color = discord.Color.blue()
-            embed.add_field(name="Time Remaining:", value="_20 seconds_")
-
-            exp = time.time() + 20
-            response = (
-                await ctx.respond(embed=embed)
-                if file is None
-                else await ctx.respond(file=file, embed=embed)
+        categories = (
+            [input_category] * question_count
+            if input_category is not None
+            else random.choices(
+                self.__CATEGORIES, self.__CATEGORY_WEIGHTS, k=question_count
             )
-            task = asyncio.get_running_loop().create_task(
-                self.__countdown_loop(response, exp, embed)
-            )
-            try:
-                msg: discord.Message = await self.__bot.wait_for(
-                    "message",
-                    check=lambda msg: self.__check_message(msg, answers, question),
-                    timeout=20,
-                )
-                answer_time = time.time() - (exp - 20)
-                task.cancel()
-                description = f"✅ Correct, **{msg.author.display_name}**! You got it in {round(answer_time)} seconds. The answer was **{question.get_answer()}**. <:frogchamp:566686914858713108>"
-                if current_question < question_count - 1:
-                    description += "\n\nNext question coming up in 5 seconds."
+        )
+        subjects = self.__draw_subjects(categories)
 
-                await ctx.respond(
-                    embed=discord.Embed(
-                        color=discord.Color.green(), description=description
-                    ),
+        answers = {}
+        next_question = asyncio.create_task(
+            self.__get_next_question(categories[0], subjects[0])
+        )
+        try:
+            for current_question in range(question_count):
+                answers.clear()
+                embed, question, file = await next_question
+
+                # Used by every wrong numeric guess and the reveal, and it never changes
+                answer = question.get_answer()
+
+                embed.title = (
+                    f"❔ _Question **{current_question+1}** of **{question_count}**_"
+                    if question_count > 1
+                    else "❔ _Question_"
+                )
+                embed.color = discord.Color.blue()
+                # Discord renders relative timestamps as a live countdown on the client,
+                # so the question never needs to be edited while it is open
+                start = time.monotonic()
+                embed.add_field(
+                    name="Time Remaining:", value=f"<t:{math.ceil(time.time() + 20)}:R>"
                 )
 
-                if msg.author.id not in correct_answers:
-                    correct_answers[msg.author.id] = 1
+                if file is None:
+                    await ctx.respond(embed=embed)
                 else:
-                    correct_answers[msg.author.id] += 1
+                    await ctx.respond(file=file, embed=embed)
+                try:
+                    msg: discord.Message | None = await self.__bot.wait_for(
+                        "message",
+                        check=partial(
+                            self.__check_message,
+                            attempted_answers=answers,
+                            question=question,
+                        ),
+                        timeout=20,
+                    )
+                except asyncio.TimeoutError:
+                    msg = None
+                except StoppedError:
+                    was_stopped = True
+                    break
+
+                # Build the following question during the reveal and pause, once the
+                # answer window has closed and a tree render can't delay guesses
                 if current_question < question_count - 1:
-                    await asyncio.sleep(5)
-            except asyncio.TimeoutError:
-                description = f"❌⏲️ Time's up! The answer was **{question.get_answer()}**. <:killmyself:472184572407447573>"
+                    next_question = asyncio.create_task(
+                        self.__get_next_question(
+                            categories[current_question + 1],
+                            subjects[current_question + 1],
+                        )
+                    )
+
+                if msg is not None:
+                    answer_time = time.monotonic() - start
+                    description = f"✅ Correct, **{msg.author.display_name}**! You got it in {round(answer_time)} seconds. The answer was **{answer}**. <:frogchamp:566686914858713108>"
+                    color = discord.Color.green()
+
+                    if msg.author.id not in correct_answers:
+                        correct_answers[msg.author.id] = 1
+                    else:
+                        correct_answers[msg.author.id] += 1
+                else:
+                    description = f"❌⏲️ Time's up! The answer was **{answer}**. <:killmyself:472184572407447573>"
+                    color = discord.Color.red()
+
                 if current_question < question_count - 1:
                     description += "\n\nNext question coming up in 5 seconds."
-
                 await ctx.respond(
-                    embed=discord.Embed(
-                        color=discord.Color.red(), description=description
-                    )
+                    embed=discord.Embed(color=color, description=description)
                 )
                 if current_question < question_count - 1:
                     await asyncio.sleep(5)
-            except StoppedError:
-                was_stopped = True
-                task.cancel()
-                break
+        finally:
+            # Covers stops and errors alike, so a prefetch is never left running
+            next_question.cancel()
 
         if not was_stopped and bool(correct_answers):
+            sorted_answers = sorted(
+                correct_answers.items(), key=lambda i: i[1], reverse=True
+            )
+            users = await asyncio.gather(
+                *(self.__resolve_user(u[0]) for u in sorted_answers)
+            )
             description = [
-                f'**{idx + 1}**. _{(await self.__bot.fetch_user(u[0])).display_name}_ (Score: **{u[1]}**) {"<:mleh:472905075208093717>" if idx == 0 else ""}'
-                for idx, u in enumerate(
-                    sorted(correct_answers.items(), key=lambda i: i[1], reverse=True)
-                )
+                f'**{idx + 1}**. _{user.display_name}_ (Score: **{u[1]}**) {"<:mleh:472905075208093717>" if idx == 0 else ""}'
+                for idx, (user, u) in enumerate(zip(users, sorted_answers))
             ]
             embed = discord.Embed(
                 color=discord.Color.blue(),
@@ -1082,48 +1283,90 @@ class SmiteTrivia(commands.Cog):
             )
             await ctx.respond(embed=embed)
 
-            current_scores = {}
+            current_scores = self.__get_scores()
+            for u, score in correct_answers.items():
+                current_scores[str(u)] = current_scores.get(str(u), 0) + score
+            self.__save_scores()
+
+    async def __resolve_user(self, user_id: int | str) -> discord.User:
+        user_id = int(user_id)
+        cached = self.__users.get(user_id)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < self.__USER_CACHE_SECONDS
+        ):
+            return cached[1]
+
+        # The client's member cache is free to read, fetching is an API call
+        user = self.__bot.get_user(user_id) or await self.__bot.fetch_user(user_id)
+        self.__users.put(user_id, (time.monotonic(), user))
+        return user
+
+    def __get_scores(self) -> Dict[str, int]:
+        if self.__scores_cache is None:
             try:
                 with open("scores.json", "r", encoding="utf-8") as f:
-                    current_scores = json.load(f)
+                    self.__scores_cache = json.load(f)
             except (FileNotFoundError, JSONDecodeError):
-                pass
-            if current_scores:
-                for u in correct_answers.keys():
-                    if str(u) not in current_scores:
-                        current_scores[str(u)] = correct_answers[u]
-                    else:
-                        current_scores[str(u)] += correct_answers[u]
-            else:
-                current_scores = correct_answers
+                self.__scores_cache = {}
+        return self.__scores_cache
+
+    def __save_scores(self):
+        self.__sorted_scores = None
+        # Rounds ending close together share one write rather than queueing several
+        self.__scores_dirty = True
+        if self.__scores_write_task is None or self.__scores_write_task.done():
+            self.__scores_write_task = self.__run_in_background(self.__flush_scores())
+
+    async def __flush_scores(self):
+        while self.__scores_dirty:
+            self.__scores_dirty = False
+            # Serialize on the loop so the snapshot is consistent, then write off it
+            try:
+                await asyncio.to_thread(
+                    self.__write_scores, json.dumps(self.__scores_cache)
+                )
+            except Exception:
+                # Keep the scores pending so the next save or unload retries them
+                self.__scores_dirty = True
+                print(f"Failed to save trivia scores: {traceback.format_exc()}")
+                return
 
-            with open("scores.json", "w", encoding="utf-8") as f:
-                json.dump(current_scores, f)
+    @staticmethod
+    def __write_scores(data: str):
+        # Write beside the real file and swap it in, so a crash mid-write
+        # can't leave a truncated scores.json behind
+        with SmiteTrivia.__SCORES_WRITE_LOCK:
+            with open("scores.json.tmp", "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace("scores.json.tmp", "scores.json")
 
     async def __scores(self, ctx):
-        try:
-            with open("scores.json", "r", encoding="utf-8") as f:
-                current_scores = json.load(f)
-                current_scores = sorted(
-                    current_scores.items(), key=lambda i: i[1], reverse=True
-                )
-                description = [
-                    f'**{idx + 1}**. _{(await self.__bot.fetch_user(u[0])).display_name}_ (Score: **{u[1]}**) {"<:mleh:472905075208093717>" if idx == 0 else ""}'
-                    for idx, u in enumerate(current_scores)
-                ]
-                embed = discord.Embed(
-                    color=discord.Color.blue(),
-                    title="**Leaderboard:**",
-                    description=str.join("\n", description),
-                ).set_thumbnail(
-                    url=(
-                        await self.__bot.fetch_user(current_scores[0][0])
-                    ).display_avatar.url
-                )
-                await ctx.channel.send(embed=embed)
-        except (FileNotFoundError, JSONDecodeError):
+        current_scores = self.__get_scores()
+        if not current_scores:
             await ctx.channel.send(
                 embed=discord.Embed(
                     color=discord.Color.blue(), title="No scores recorded yet!"
                 )
             )
+            return
+
+        if self.__sorted_scores is None:
+            self.__sorted_scores = sorted(
+                current_scores.items(), key=lambda i: i[1], reverse=True
+            )
+        current_scores = self.__sorted_scores
+        # Each lookup is its own API round trip, so issue them all at once
+        users = await asyncio.gather(
+            *(self.__resolve_user(u[0]) for u in current_scores)
+        )
+        description = [
+            f'**{idx + 1}**. _{user.display_name}_ (Score: **{u[1]}**) {"<:mleh:472905075208093717>" if idx == 0 else ""}'
+            for idx, (user, u) in enumerate(zip(users, current_scores))
+        ]
+        embed = discord.Embed(
+            color=discord.Color.blue(),
+            title="**Leaderboard:**",
+            description=str.join("\n", description),
+        ).set_thumbnail(url=users[0].display_avatar.url)
+        await ctx.channel.send(embed=embed)
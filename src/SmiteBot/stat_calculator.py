@@ -1,11 +1,16 @@
-import copy
 import random
 
-from enum import Enum
-from typing import Dict, List, NamedTuple, Tuple, Union
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Tuple
 
 from god import God, GodId, GodRole, GodType
-from item import Item, ItemAttribute
+from item import Item, ItemAttribute, ItemProperty
+from lru_cache import LRUCache
+
+_ITEM_ATTRIBUTES = tuple(ItemAttribute)
+_PENETRATION_ATTRIBUTES = frozenset(
+    (ItemAttribute.MAGICAL_PENETRATION, ItemAttribute.PHYSICAL_PENETRATION)
+)
 
 
 class BaseCalculator:
@@ -77,24 +82,27 @@ class _Stats:
         self.stats = {}
         self.overcapped_stats = {}
 
+    def copy(self) -> "_Stats":
+        # Stats are only ever replaced, never changed in place, so the values can
+        # be shared between copies
+        stats = _Stats()
+        stats.stats = dict(self.stats)
+        stats.overcapped_stats = dict(self.overcapped_stats)
+        return stats
+
     def set_stat(self, stat: ItemAttribute, value: float | _Penetration):
         self.stats[stat] = value
 
     def add_or_set_stat(self, stat: ItemAttribute, value: float | _Penetration):
-        if self.has_stat(stat):
-            if stat in (
-                ItemAttribute.MAGICAL_PENETRATION,
-                ItemAttribute.PHYSICAL_PENETRATION,
-            ):
-                pen = self.get_stat(stat)
-                self.set_stat(
-                    stat,
-                    _Penetration(pen.flat + value.flat, pen.percent + value.percent),
-                )
-                return
-            self.set_stat(stat, self.get_stat(stat) + value)
+        current = self.stats.get(stat)
+        if current is None:
+            self.stats[stat] = value
+        elif stat in _PENETRATION_ATTRIBUTES:
+            self.stats[stat] = _Penetration(
+                current.flat + value.flat, current.percent + value.percent
+            )
         else:
-            self.set_stat(stat, value)
+            self.stats[stat] = current + value
 
     def get_stat(self, stat: ItemAttribute) -> float | _Penetration:
         return self.stats[stat]
@@ -106,22 +114,8 @@ class _Stats:
         del self.stats[stat]
 
     def merge(self, other):
-        for stat in other.stats.keys():
-            if self.has_stat(stat):
-                if stat in (
-                    ItemAttribute.MAGICAL_PENETRATION,
-                    ItemAttribute.PHYSICAL_PENETRATION,
-                ):
-                    first = self.get_stat(stat)
-                    second = other.get_stat(stat)
-                    updated_tuple = _Penetration(
-                        first.flat + second.flat, first.percent + second.percent
-                    )
-                    self.set_stat(stat, updated_tuple)
-                    continue
-                self.set_stat(stat, self.get_stat(stat) + other.get_stat(stat))
-            else:
-                self.set_stat(stat, other.get_stat(stat))
+        for stat, value in other.stats.items():
+            self.add_or_set_stat(stat, value)
 
 
 class GodBuild:
@@ -162,27 +156,54 @@ class BuildStatCalculator:
         ItemAttribute.COOLDOWN_REDUCTION: 0.40,
     }
 
+    # Each item's properties that apply to a god type, shared across calculators
+    # since the item catalog doesn't change while running
+    __type_properties: Dict[Tuple[int, GodType], List[ItemProperty]] = {}
+    # God stats by (god id, level), since god data is only loaded at startup
+    __god_stats: Dict[Tuple[GodId, int], _Stats] = {}
+    # Item stats by (item id, god id)
+    __item_stats: LRUCache[Tuple[int, GodId], _Stats] = LRUCache(4096)
+
     def __init__(self, god: GodBuild):
         self.god = god
 
+    @staticmethod
+    def __get_type_properties(item: Item, god_type: GodType) -> List[ItemProperty]:
+        key = (item.id, god_type)
+        properties = BuildStatCalculator.__type_properties.get(key)
+        if properties is None:
+            properties = BuildStatCalculator.__type_properties[key] = [
+                prop
+                for prop in item.item_properties
+                if prop.attribute.god_type is None
+                or prop.attribute.god_type == god_type
+            ]
+        return properties
+
     def calculate_god_stats(self) -> _Stats:
-        god_stats = _Stats()
-        for stat in list(ItemAttribute):
-            stat_at_level = self.god.god.get_stat_at_level(stat, self.god.level)
-            if stat_at_level > 0:
-                if stat == ItemAttribute.PHYSICAL_PENETRATION:
-                    god_stats.set_stat(stat, _Penetration(stat_at_level, 0))
-                    continue
-                god_stats.set_stat(stat, stat_at_level)
-        return god_stats
+        key = (self.god.god.id, self.god.level)
+        god_stats = self.__god_stats.get(key)
+        if god_stats is None:
+            god_stats = self.__god_stats[key] = _Stats()
+            for stat in _ITEM_ATTRIBUTES:
+                stat_at_level = self.god.god.get_stat_at_level(stat, self.god.level)
+                if stat_at_level > 0:
+                    if stat == ItemAttribute.PHYSICAL_PENETRATION:
+                        god_stats.set_stat(stat, _Penetration(stat_at_level, 0))
+                        continue
+                    god_stats.set_stat(stat, stat_at_level)
+        # Build stats are added on top of these, so callers get their own copy
+        return god_stats.copy()
 
     def calculate_item_stats(self, item: Item) -> _Stats:
         item_stats = _Stats()
+        # Read for every property, so the god is looked up once per item
+        god = self.god.god
 
         # Heartward Amulet
         if item.id in (21504, 21505, 11116):
             item_stats.add_or_set_stat(ItemAttribute.MAGICAL_PROTECTION, 20)
-            if self.god.god.id in (GodId.CU_CHULAINN, GodId.YEMOJA):
+            if god.id in (GodId.CU_CHULAINN, GodId.YEMOJA):
                 item_stats.add_or_set_stat(ItemAttribute.HP5, 30)
             else:
                 item_stats.add_or_set_stat(ItemAttribute.MP5, 30)
@@ -195,18 +216,13 @@ class BuildStatCalculator:
             item_stats.add_or_set_stat(ItemAttribute.MAGICAL_PROTECTION, 30)
             item_stats.add_or_set_stat(ItemAttribute.PHYSICAL_PROTECTION, 30)
 
-        for prop in item.item_properties:
-            if (
-                prop.attribute.god_type is not None
-                and prop.attribute.god_type != self.god.god.type
-            ):
-                continue
+        for prop in self.__get_type_properties(item, god.type):
             if (
                 prop.attribute == ItemAttribute.ATTACK_SPEED
-                and self.god.god.id == GodId.KING_ARTHUR
+                and god.id == GodId.KING_ARTHUR
             ):
                 continue
-            if self.god.god.id in (GodId.CU_CHULAINN, GodId.YEMOJA):
+            if god.id in (GodId.CU_CHULAINN, GodId.YEMOJA):
                 if prop.attribute == ItemAttribute.MANA:
                     item_stats.add_or_set_stat(ItemAttribute.HEALTH, prop.flat_value)
                     continue
@@ -225,7 +241,7 @@ class BuildStatCalculator:
                 if prop.attribute == ItemAttribute.PENETRATION:
                     stat = (
                         ItemAttribute.MAGICAL_PENETRATION
-                        if self.god.god.type == GodType.MAGICAL
+                        if god.type is GodType.MAGICAL
                         else ItemAttribute.PHYSICAL_PENETRATION
                     )
                 item_stats.add_or_set_stat(
@@ -234,13 +250,13 @@ class BuildStatCalculator:
                 continue
             if (
                 prop.attribute == ItemAttribute.PHYSICAL_CRITICAL_STRIKE_CHANCE
-                and self.god.god.type == GodType.PHYSICAL
+                and god.type is GodType.PHYSICAL
             ):
                 item_stats.add_or_set_stat(
                     ItemAttribute.CRITICAL_STRIKE_CHANCE, prop.percent_value
                 )
             if prop.attribute == ItemAttribute.LIFESTEAL:
-                if self.god.god.type == GodType.PHYSICAL:
+                if god.type is GodType.PHYSICAL:
                     item_stats.add_or_set_stat(
                         ItemAttribute.PHYSICAL_LIFESTEAL, prop.percent_value
                     )
@@ -253,10 +269,20 @@ class BuildStatCalculator:
             )
         return item_stats
 
+    def __get_item_stats(self, item: Item) -> _Stats:
+        # The optimizer tries many builds for one god out of the same items, so
+        # each item's stats are worked out once per god and only read after that
+        key = (item.id, self.god.god.id)
+        stats = self.__item_stats.get(key)
+        if stats is None:
+            stats = self.calculate_item_stats(item)
+            self.__item_stats.put(key, stats)
+        return stats
+
     def calculate_build_stats(self) -> _Stats:
         build_stats = _Stats()
         for item in self.god.build:
-            build_stats.merge(self.calculate_item_stats(item))
+            build_stats.merge(self.__get_item_stats(item))
         return build_stats
 
     def _fix_overcapped(self, stats: _Stats) -> _Stats:
@@ -267,13 +293,16 @@ class BuildStatCalculator:
                 if stat == ItemAttribute.ATTACK_SPEED:
                     attack_speed = self.god.god.get_stat_at_level(stat, 20)
                     value = attack_speed + attack_speed * value
-                if stat in (
-                    ItemAttribute.MAGICAL_PENETRATION,
-                    ItemAttribute.PHYSICAL_PENETRATION,
-                ):
+                if stat in _PENETRATION_ATTRIBUTES:
                     if self.god.god.role == GodRole.ASSASSIN:
-                        value.flat += self.god.god.get_stat_at_level(stat, 20)
-                    if float(f"{value.flat:.2f}") > float(f"{cap:.2f}"):
+                        # Rebuilt rather than bumped in place, since the stored
+                        # penetration may be shared with the item stats it came from
+                        value = _Penetration(
+                            value.flat + self.god.god.get_stat_at_level(stat, 20),
+                            value.percent,
+                        )
+                        stats.set_stat(stat, value)
+                    if round(value.flat, 2) > round(cap, 2):
                         if stat in stats.overcapped_stats:
                             overcapped_pen = stats.overcapped_stats[stat]
                             overcapped_pen.flat = value.flat
@@ -282,17 +311,14 @@ class BuildStatCalculator:
                             stats.overcapped_stats[stat] = _Penetration(value.flat, 0)
                         stats.set_stat(stat, _Penetration(cap, value.percent))
                     continue
-                if float(f"{value:.2f}") > float(f"{cap:.2f}"):
+                if round(value, 2) > round(cap, 2):
                     stats.overcapped_stats[stat] = value
-                    stats.set_stat(stat, value)
+                    stats.set_stat(stat, cap)
             if stat in self.PERCENT_ITEM_ATTRIBUTE_CAPS:
                 value = stats.get_stat(stat)
                 cap = self.PERCENT_ITEM_ATTRIBUTE_CAPS[stat]
-                if stat in (
-                    ItemAttribute.MAGICAL_PENETRATION,
-                    ItemAttribute.PHYSICAL_PENETRATION,
-                ):
-                    if float(f"{value.percent:.2f}") > float(f"{cap:.2f}"):
+                if stat in _PENETRATION_ATTRIBUTES:
+                    if round(value.percent, 2) > round(cap, 2):
                         if stat in stats.overcapped_stats:
                             overcapped_pen = stats.overcapped_stats[stat]
                             overcapped_pen.percent = value.percent
@@ -313,7 +339,7 @@ class BuildStatCalculator:
                     and self.god.god.role == GodRole.GUARDIAN
                 ):
                     value += self.god.god.get_stat_at_level(stat, 20)
-                if float(f"{value:.2f}") > float(f"{cap:.2f}"):
+                if round(value, 2) > round(cap, 2):
                     stats.overcapped_stats[stat] = value
                     stats.set_stat(stat, cap)
         return stats
@@ -377,25 +403,46 @@ class BuildStatCalculator:
         return stats
 
 
+class _BasicAttack(NamedTuple):
+    # Everything about a basic attack that stays fixed for a pair of builds
+    power_type: ItemAttribute
+    pen_type: ItemAttribute
+    prot_type: ItemAttribute
+    can_crit: bool
+    is_izanami: bool
+    crit_bonus: float
+    damage_mit: float
+    has_qins: bool
+    prophetic_cloaks: int
+
+
 class DamageCalculator:
+    # Build stats by (god id, item ids, level)
+    __build_stats: LRUCache[Tuple[GodId, Tuple[int, ...], int], _Stats] = LRUCache(1024)
+
     @staticmethod
-    def calculate_basic_damage_dealt(
-        attacking_god: GodBuild,
-        defending_god: GodBuild,
-        attacking_stats: _Stats,
-        defending_stats: _Stats,
-        progression: float = 1,
-        pct_red: float = 0,
-        damage_mit: float = 0,
-        crit_bonus: float = 1.75,
-    ) -> Tuple[float, bool]:
-        power_type = (
-            ItemAttribute.PHYSICAL_POWER
-            if attacking_god.god.type == GodType.PHYSICAL
-            else ItemAttribute.MAGICAL_POWER
+    def __get_god_build_stats(god_build: GodBuild) -> _Stats:
+        # Builds are compared against the same gods over and over, so their stats
+        # are reused instead of being recalculated for every comparison
+        key = (
+            god_build.god.id,
+            tuple(item.id for item in god_build.build),
+            god_build.level,
         )
+        stats = DamageCalculator.__build_stats.get(key)
+        if stats is None:
+            stats = BuildStatCalculator(god_build).calculate_god_build_stats()
+            DamageCalculator.__build_stats.put(key, stats)
+        # Callers adjust their stats as passives stack, so each gets its own copy
+        return stats.copy()
 
-        crit_chance = 0
+    @staticmethod
+    def __get_basic_attack(
+        attacking_god: GodBuild, defending_god: GodBuild
+    ) -> _BasicAttack:
+        is_physical = attacking_god.god.type is GodType.PHYSICAL
+
+        crit_bonus = 0
         has_qins = False
         for item in attacking_god.build:
             # Deathbringer and glyphs
@@ -406,25 +453,82 @@ class DamageCalculator:
             if item.id == 7593:
                 has_qins = True
 
+        damage_mit = 0
+        prophetic_cloaks = 0
         for item in defending_god.build:
             # Evolved Prophetic Cloak
             if item.id == 24172:
-                total_prots = defending_stats.get_stat(
-                    ItemAttribute.MAGICAL_PROTECTION
-                ) + defending_stats.get_stat(ItemAttribute.PHYSICAL_PROTECTION)
-
-                if total_prots > 600:
-                    damage_mit += 0.20
-                elif total_prots > 400:
-                    damage_mit += 0.10
+                prophetic_cloaks += 1
             # Sigil of the Old Guard
             if item.id == 19752:
                 damage_mit += 0.05
 
-        if (
-            attacking_god.god.type == GodType.PHYSICAL
-            or attacking_god.god.id == GodId.OLORUN
-        ):
+        return _BasicAttack(
+            ItemAttribute.PHYSICAL_POWER
+            if is_physical
+            else ItemAttribute.MAGICAL_POWER,
+            ItemAttribute.PHYSICAL_PENETRATION
+            if is_physical
+            else ItemAttribute.MAGICAL_PENETRATION,
+            ItemAttribute.PHYSICAL_PROTECTION
+            if is_physical
+            else ItemAttribute.MAGICAL_PROTECTION,
+            is_physical or attacking_god.god.id == GodId.OLORUN,
+            attacking_god.god.id == GodId.IZANAMI,
+            crit_bonus,
+            damage_mit,
+            has_qins,
+            prophetic_cloaks,
+        )
+
+    @staticmethod
+    def calculate_basic_damage_dealt(
+        attacking_god: GodBuild,
+        defending_god: GodBuild,
+        attacking_stats: _Stats,
+        defending_stats: _Stats,
+        progression: float = 1,
+        pct_red: float = 0,
+        damage_mit: float = 0,
+        crit_bonus: float = 1.75,
+    ) -> Tuple[float, bool]:
+        return DamageCalculator.__basic_damage_dealt(
+            attacking_god,
+            DamageCalculator.__get_basic_attack(attacking_god, defending_god),
+            attacking_stats,
+            defending_stats,
+            progression,
+            pct_red,
+            damage_mit,
+            crit_bonus,
+        )
+
+    @staticmethod
+    def __basic_damage_dealt(
+        attacking_god: GodBuild,
+        basic_attack: _BasicAttack,
+        attacking_stats: _Stats,
+        defending_stats: _Stats,
+        progression: float,
+        pct_red: float,
+        damage_mit: float,
+        crit_bonus: float,
+    ) -> Tuple[float, bool]:
+        crit_bonus += basic_attack.crit_bonus
+        damage_mit += basic_attack.damage_mit
+
+        if basic_attack.prophetic_cloaks:
+            total_prots = defending_stats.get_stat(
+                ItemAttribute.MAGICAL_PROTECTION
+            ) + defending_stats.get_stat(ItemAttribute.PHYSICAL_PROTECTION)
+
+            if total_prots > 600:
+                damage_mit += 0.20 * basic_attack.prophetic_cloaks
+            elif total_prots > 400:
+                damage_mit += 0.10 * basic_attack.prophetic_cloaks
+
+        crit_chance = 0
+        if basic_attack.can_crit:
             if attacking_stats.has_stat(ItemAttribute.CRITICAL_STRIKE_CHANCE):
                 crit_chance = attacking_stats.get_stat(
                     ItemAttribute.CRITICAL_STRIKE_CHANCE
@@ -436,14 +540,14 @@ class DamageCalculator:
             attacking_god.god.stats.basic_attack.base_damage,
             attacking_god.god.stats.basic_attack.per_level,
             attacking_god.level,
-            attacking_stats.get_stat(power_type),
+            attacking_stats.get_stat(basic_attack.power_type),
             attacking_god.god.stats.basic_attack.scaling,
             progression,
             is_crit,
             crit_bonus,
         )
 
-        if has_qins:
+        if basic_attack.has_qins:
             defending_health = defending_stats.get_stat(ItemAttribute.HEALTH)
             qins_bonus = (
                 0.03
@@ -452,38 +556,28 @@ class DamageCalculator:
             )
             total_basic_damage += defending_health * qins_bonus
 
-        if attacking_god.god.id == GodId.IZANAMI:
+        if basic_attack.is_izanami:
             is_crit = random.randrange(0, 100) < (crit_chance * 100)
             total_basic_damage += BaseCalculator.basic_attack_damage(
                 attacking_god.god.stats.basic_attack.base_damage_back,
                 attacking_god.god.stats.basic_attack.per_level_back,
                 attacking_god.level,
-                attacking_stats.get_stat(power_type),
+                attacking_stats.get_stat(basic_attack.power_type),
                 attacking_god.god.stats.basic_attack.scaling_back,
                 progression,
                 is_crit,
                 crit_bonus,
             )
 
-        pen_type = (
-            ItemAttribute.PHYSICAL_PENETRATION
-            if attacking_god.god.type == GodType.PHYSICAL
-            else ItemAttribute.MAGICAL_PENETRATION
-        )
-
         attacking_god_penetration = (
-            attacking_stats.get_stat(pen_type)
-            if attacking_stats.has_stat(pen_type)
+            attacking_stats.get_stat(basic_attack.pen_type)
+            if attacking_stats.has_stat(basic_attack.pen_type)
             else _Penetration(0, 0)
         )
 
         total_damage_dealt = BaseCalculator.damage_dealt(
             total_basic_damage,
-            defending_stats.get_stat(
-                ItemAttribute.PHYSICAL_PROTECTION
-                if attacking_god.god.type == GodType.PHYSICAL
-                else ItemAttribute.MAGICAL_PROTECTION
-            ),
+            defending_stats.get_stat(basic_attack.prot_type),
             pct_red,
             0,
             attacking_god_penetration.percent,
@@ -501,12 +595,8 @@ class DamageCalculator:
         defending_god: GodBuild,
         assume_item_passives_stacked: bool = False,
     ) -> float:
-        attacking_god_stats = BuildStatCalculator(
-            attacking_god
-        ).calculate_god_build_stats()
-        defending_god_stats = BuildStatCalculator(
-            defending_god
-        ).calculate_god_build_stats()
+        attacking_god_stats = DamageCalculator.__get_god_build_stats(attacking_god)
+        defending_god_stats = DamageCalculator.__get_god_build_stats(defending_god)
 
         has_demon_blade = False
         has_silverbranch = False
@@ -596,11 +686,13 @@ class DamageCalculator:
 
         renewal_exp = 0
         renewal_cd = 0
-        renewal_stacks: List[float] = []
+        # Stacks are kept in the order they expire in, since each one lasts a fixed
+        # time from when it was applied
+        renewal_stacks: Deque[float] = deque()
 
-        midgardian_stacks: List[float] = []
+        midgardian_stacks: Deque[float] = deque()
 
-        spectral_stacks: List[float] = []
+        spectral_stacks: Deque[float] = deque()
 
         dmg = 0
         damage_mit = 0
@@ -620,7 +712,7 @@ class DamageCalculator:
         )
         og_power = (
             attacking_god_stats.get_stat(ItemAttribute.PHYSICAL_POWER)
-            if attacking_god.god.type == GodType.PHYSICAL
+            if attacking_god.god.type is GodType.PHYSICAL
             else 0
         )
 
@@ -630,26 +722,8 @@ class DamageCalculator:
                 ItemAttribute.ATTACK_SPEED
             ]
 
-        def expire_renewal_stack(exp_time: float) -> bool:
-            if seconds >= exp_time:
-                defending_god_stats.add_or_set_stat(
-                    ItemAttribute.MAGICAL_PROTECTION, -4
-                )
-                defending_god_stats.add_or_set_stat(
-                    ItemAttribute.PHYSICAL_PROTECTION, -4
-                )
-                return True
-            return False
-
-        def expire_spectral_stack(exp_time: float) -> bool:
-            if seconds >= exp_time:
-                return True
-            return False
-
-        def expire_stack(exp_time: float) -> bool:
-            if seconds >= exp_time:
-                return True
-            return False
+        # The builds don't change during the fight, so they're only scanned once
+        basic_attack = DamageCalculator.__get_basic_attack(attacking_god, defending_god)
 
         while defending_health > 0:
             pre_fire_seconds = seconds
@@ -692,27 +766,32 @@ class DamageCalculator:
                 damage_mit = 0
 
             # Clear expired Renewal stacks
-            renewal_stacks[:] = [
-                s for s in renewal_stacks if not expire_renewal_stack(s)
-            ]
+            while renewal_stacks and renewal_stacks[0] <= seconds:
+                renewal_stacks.popleft()
+                defending_god_stats.add_or_set_stat(
+                    ItemAttribute.MAGICAL_PROTECTION, -4
+                )
+                defending_god_stats.add_or_set_stat(
+                    ItemAttribute.PHYSICAL_PROTECTION, -4
+                )
 
             # Clear expired Midgardian stacks
-            midgardian_stacks[:] = [s for s in midgardian_stacks if not expire_stack(s)]
+            while midgardian_stacks and midgardian_stacks[0] <= seconds:
+                midgardian_stacks.popleft()
 
             # Clear expired Spectral stacks
             pre_expire_count = len(spectral_stacks)
-            spectral_stacks[:] = [
-                s for s in spectral_stacks if not expire_spectral_stack(s)
-            ]
+            while spectral_stacks and spectral_stacks[0] <= seconds:
+                spectral_stacks.popleft()
             expire_diff = pre_expire_count - len(spectral_stacks)
             if expire_diff > 0:
                 crit_bonus += 0.05 * expire_diff
 
             # Calculate damage
             if progression is not None and progression.has_progression:
-                dmg, is_crit = DamageCalculator.calculate_basic_damage_dealt(
+                dmg, is_crit = DamageCalculator.__basic_damage_dealt(
                     attacking_god,
-                    defending_god,
+                    basic_attack,
                     attacking_god_stats,
                     defending_god_stats,
                     progression.damage[p_idx],
@@ -723,14 +802,15 @@ class DamageCalculator:
                 seconds += (1 / attack_speed) * progression.swing_time[p_idx]
                 p_idx = 1 + p_idx if p_idx < len(progression.damage) else 0
             else:
-                dmg, is_crit = DamageCalculator.calculate_basic_damage_dealt(
+                dmg, is_crit = DamageCalculator.__basic_damage_dealt(
                     attacking_god,
-                    defending_god,
+                    basic_attack,
                     attacking_god_stats,
                     defending_god_stats,
-                    pct_red=red_pct,
-                    damage_mit=damage_mit,
-                    crit_bonus=crit_bonus,
+                    1,
+                    red_pct,
+                    damage_mit,
+                    crit_bonus,
                 )
                 seconds += 1 / attack_speed
 
@@ -781,7 +861,7 @@ class DamageCalculator:
                         defending_god_stats.get_stat(ItemAttribute.HEALTH) * 0.15
                     )
                     renewal_cd = pre_fire_seconds + 60
-                    renewal_stacks = []
+                    renewal_stacks.clear()
 
             # Proc Midgardian Mail
             if has_midgardian_mail and len(midgardian_stacks) < 3: